@@ -24,7 +24,7 @@ from typing import Tuple
 import click
 from packaging.version import parse
 
-from .config.dockerfile_template import _DOCKERFILE_TEMPLATE
+from .config.dockerfile_template import render_dockerfile
 from .deployers.deployer_factory import DeployerFactory
 
 _AGENT_ENGINE_APP_TEMPLATE: Final[str] = """
@@ -62,6 +62,7 @@ def _resolve_project(project_in_option: Optional[str]) -> str:
   click.echo(f'Use default project: {project}')
   return project
 
+
 def _get_service_option_by_adk_version(
     adk_version: str,
     session_uri: Optional[str],
@@ -150,7 +151,6 @@ def run(
   """
   app_name = app_name or os.path.basename(agent_folder)
   mode = 'web' if with_ui else 'api_server'
-  trace_to_cloud_option = '--trace_to_cloud' if trace_to_cloud else ''
 
   click.echo(f'Start generating deployment files in {temp_folder}')
 
@@ -174,29 +174,27 @@ def run(
 
     # create Dockerfile
     click.echo('Creating Dockerfile...')
-    host_option = '--host=0.0.0.0' if adk_version > '0.5.0' else ''
-    allow_origins_option = (
-        f'--allow_origins={",".join(allow_origins)}' if allow_origins else ''
+    service_option = ' '.join(
+        _get_service_option_by_adk_version(
+            adk_version,
+            session_service_uri,
+            artifact_service_uri,
+            memory_service_uri,
+        ).split()
     )
-    a2a_option = '--a2a' if a2a else ''
-    dockerfile_content = _DOCKERFILE_TEMPLATE.format(
+    dockerfile_content = render_dockerfile(
         gcp_project_id=project,
         gcp_region=region,
         app_name=app_name,
         port=port,
         command=mode,
         install_agent_deps=install_agent_deps,
-        service_option=_get_service_option_by_adk_version(
-            adk_version,
-            session_service_uri,
-            artifact_service_uri,
-            memory_service_uri,
-        ),
-        trace_to_cloud_option=trace_to_cloud_option,
-        allow_origins_option=allow_origins_option,
+        service_option=service_option,
+        trace_to_cloud=trace_to_cloud,
+        allow_origins=allow_origins,
         adk_version=adk_version,
-        host_option=host_option,
-        a2a_option=a2a_option,
+        host='0.0.0.0' if adk_version > '0.5.0' else '',
+        a2a=a2a,
     )
     dockerfile_path = os.path.join(temp_folder, 'Dockerfile')
     os.makedirs(temp_folder, exist_ok=True)
@@ -569,32 +567,30 @@ def to_gke(
     )
     click.secho('✅ Environment prepared.', fg='green')
 
-    allow_origins_option = (
-        f'--allow_origins={",".join(allow_origins)}' if allow_origins else ''
-    )
-
     # create Dockerfile
     click.secho('\nSTEP 2: Generating deployment files...', bold=True)
     click.echo('  - Creating Dockerfile...')
-    host_option = '--host=0.0.0.0' if adk_version > '0.5.0' else ''
-    dockerfile_content = _DOCKERFILE_TEMPLATE.format(
+    service_option = ' '.join(
+        _get_service_option_by_adk_version(
+            adk_version,
+            session_service_uri,
+            artifact_service_uri,
+            memory_service_uri,
+        ).split()
+    )
+    dockerfile_content = render_dockerfile(
         gcp_project_id=project,
         gcp_region=region,
         app_name=app_name,
         port=port,
         command='web' if with_ui else 'api_server',
         install_agent_deps=install_agent_deps,
-        service_option=_get_service_option_by_adk_version(
-            adk_version,
-            session_service_uri,
-            artifact_service_uri,
-            memory_service_uri,
-        ),
-        trace_to_cloud_option='--trace_to_cloud' if trace_to_cloud else '',
-        allow_origins_option=allow_origins_option,
+        service_option=service_option,
+        trace_to_cloud=trace_to_cloud,
+        allow_origins=allow_origins,
         adk_version=adk_version,
-        host_option=host_option,
-        a2a_option='--a2a' if a2a else '',
+        host='0.0.0.0' if adk_version > '0.5.0' else '',
+        a2a=a2a,
     )
     dockerfile_path = os.path.join(temp_folder, 'Dockerfile')
     os.makedirs(temp_folder, exist_ok=True)
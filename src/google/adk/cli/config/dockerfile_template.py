@@ -1,7 +1,14 @@
 # config/dockerfile_template.py
 
-_DOCKERFILE_TEMPLATE = """
-FROM python:3.11-slim
+from __future__ import annotations
+
+from jinja2 import BaseLoader
+from jinja2 import Environment
+
+# The syntax directive must be the first line of the Dockerfile; it enables
+# BuildKit features such as RUN cache mounts.
+_DOCKERFILE_TEMPLATE = """# syntax=docker/dockerfile:1.4
+FROM python:3.11-slim AS builder
 WORKDIR /app
 
 # Create a non-root user
@@ -13,15 +20,49 @@ USER myuser
 # Set up environment variables
 ENV PATH="/home/myuser/.local/bin:$PATH"
 
-# Install ADK
-RUN pip install google-adk=={adk_version}
+# Install ADK into the user site, keeping pip's wheel cache across builds
+# via BuildKit
+RUN --mount=type=cache,target=/home/myuser/.cache/pip,uid=1000 pip install --user --no-warn-script-location google-adk=={{ adk_version }}
+
+# Copy agent so agent-level requirements can be installed in this stage
+COPY --chown=myuser:myuser "agents/{{ app_name }}/" "/app/agents/{{ app_name }}/"
+{{ install_agent_deps }}
+
+# Runtime stage: only the installed packages and the agent source are
+# carried over, leaving pip's build artifacts behind in the builder.
+FROM python:3.11-slim AS runtime
+WORKDIR /app
+
+# Create a non-root user
+RUN adduser --disabled-password --gecos "" myuser
+
+COPY --from=builder --chown=myuser:myuser /home/myuser/.local /home/myuser/.local
+
+# Switch to the non-root user
+USER myuser
+
+# Set up environment variables
+ENV PATH="/home/myuser/.local/bin:$PATH"
 
 # Copy agent
 # Set permission
-COPY --chown=myuser:myuser "agents/{app_name}/" "/app/agents/{app_name}/"
-{install_agent_deps}
+COPY --chown=myuser:myuser "agents/{{ app_name }}/" "/app/agents/{{ app_name }}/"
 
-EXPOSE {port}
+EXPOSE {{ port }}
 
-CMD adk {command} --port={port} {host_option} {service_option} {trace_to_cloud_option} {allow_origins_option} {a2a_option} "/app/agents"
+CMD adk {{ command }} --port={{ port }}{% if host %} --host={{ host }}{% endif %}{% if service_option %} {{ service_option }}{% endif %}{% if trace_to_cloud %} --trace_to_cloud{% endif %}{% if allow_origins %} --allow_origins={{ allow_origins|join(',') }}{% endif %}{% if a2a %} --a2a{% endif %} "/app/agents"
 """
+
+# Compiled once at import so every deploy reuses the same template bytecode
+# instead of re-parsing the format string.
+_DOCKERFILE = Environment(
+    loader=BaseLoader(),
+    autoescape=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+).from_string(_DOCKERFILE_TEMPLATE)
+
+
+def render_dockerfile(**context) -> str:
+  """Renders the deployment Dockerfile from the precompiled template."""
+  return _DOCKERFILE.render(**context)
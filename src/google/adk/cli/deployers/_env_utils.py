@@ -0,0 +1,58 @@
+# deployers/_env_utils.py
+
+"""Shared `.env` file helpers for the deployers."""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+from typing import Tuple
+
+# Parsed `.env` contents keyed by (path, mtime_ns, size). A plain dict
+# rather than lru_cache so the already-open fd from _open_env can be
+# streamed on a miss; a deploy touches a handful of files at most.
+_parse_cache: dict = {}
+
+
+def _open_env(path: str) -> Tuple[Optional[int], int, int]:
+  """Opens the env file, returning `(fd_or_none, size, mtime_ns)`.
+
+  A single `os.open` replaces the usual `exists()`-then-`open()` pair: the
+  fd doubles as the existence check and `os.fstat` on it yields the size
+  and mtime used as the parse-cache key. Callers own the returned fd and
+  must close it (or hand it to `_parse_env_file`).
+  """
+  try:
+    fd = os.open(path, os.O_RDONLY)
+  except (FileNotFoundError, NotADirectoryError):
+    return None, 0, 0
+  stat = os.fstat(fd)
+  return fd, stat.st_size, stat.st_mtime_ns
+
+
+def _parse_env_file(
+    path: str, fd: int, size: int, mtime_ns: int
+) -> Tuple[str, ...]:
+  """Parses a `.env` file into an immutable tuple of 'KEY=VALUE' strings.
+
+  Memoized by `(path, mtime_ns, size)` so repeat deploys skip re-reading
+  and re-splitting the file unless it changed on disk. On a miss the
+  content is read from the fd handed over by `_open_env`; either way the
+  fd is consumed. The line filter is a single comprehension over
+  `str.splitlines`, so the iteration stays in one C-level loop with no
+  per-line Python frame.
+  """
+  key = (path, mtime_ns, size)
+  cached = _parse_cache.get(key)
+  if cached is not None:
+    os.close(fd)
+    return cached
+  with os.fdopen(fd, 'rb') as f:
+    text = f.read().decode()
+  parsed = tuple(
+      stripped
+      for line in text.splitlines()
+      if (stripped := line.strip()) and stripped[0] != '#' and '=' in stripped
+  )
+  _parse_cache[key] = parsed
+  return parsed
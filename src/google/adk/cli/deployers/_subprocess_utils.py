@@ -0,0 +1,53 @@
+# deployers/_subprocess_utils.py
+
+"""Shared subprocess helpers for the deployers."""
+
+from __future__ import annotations
+
+import shlex
+import subprocess
+from typing import List
+from typing import Optional
+
+import click
+
+
+def _start_streamed(
+    cmd: List[str], *, env: Optional[dict] = None
+) -> subprocess.Popen:
+  """Starts a command with its combined output piped, unbuffered.
+
+  The command runs without a shell; `shlex.join` is used only for the log
+  line. The pipe is unbuffered bytes so interactive prompts written
+  without a trailing newline (e.g. gcloud's region selection) surface
+  immediately; stdin stays inherited so the user can answer them. Callers
+  that have useful work to do while the child runs can do it between this
+  call and `_finish_streamed`.
+  """
+  click.echo(f'Running: {shlex.join(cmd)}')
+  return subprocess.Popen(
+      cmd,
+      stdout=subprocess.PIPE,
+      stderr=subprocess.STDOUT,
+      bufsize=0,
+      env=env,
+  )
+
+
+def _finish_streamed(proc: subprocess.Popen, cmd: List[str]) -> None:
+  """Streams a started command's output through click.echo and checks it.
+
+  Raises CalledProcessError on a non-zero exit, matching
+  `subprocess.run(check=True)`.
+  """
+  # Raw reads return as soon as any output is available, so partial lines
+  # (prompts) are echoed without waiting for a newline.
+  for chunk in iter(lambda: proc.stdout.read(4096), b''):
+    click.echo(chunk, nl=False)
+  if proc.wait() != 0:
+    raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def _run_streamed(cmd: List[str], *, env: Optional[dict] = None) -> None:
+  """Runs a command to completion, streaming its output as it arrives."""
+  _finish_streamed(_start_streamed(cmd, env=env), cmd)
@@ -1,6 +1,11 @@
+from __future__ import annotations
+
+import concurrent.futures
 from abc import ABC
 from abc import abstractmethod
+from typing import Any
 from typing import Dict
+from typing import List
 
 
 class Deployer(ABC):
@@ -16,3 +21,19 @@ class Deployer(ABC):
   ):
     """Deploys the agent to the target platform."""
     pass
+
+  def deploy_many(self, specs: List[Dict[str, Any]]) -> List[Any]:
+    """Deploys multiple services concurrently.
+
+    Each spec is a dict of keyword arguments for `deploy`. The hot path of
+    a deploy is a blocking subprocess waiting on the network, so a thread
+    pool overlaps the deploys well. Results are returned in completion
+    order; a failed deploy raises its exception here.
+    """
+    if not specs:
+      return []
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(8, len(specs))
+    ) as executor:
+      futures = [executor.submit(self.deploy, **spec) for spec in specs]
+      return [f.result() for f in concurrent.futures.as_completed(futures)]
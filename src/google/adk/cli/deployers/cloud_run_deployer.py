@@ -1,16 +1,233 @@
 # deployers/cloud_run_deployer.py
 
+from __future__ import annotations
+
+import collections
+import configparser
+import functools
+import io
+import json
 import os
 import subprocess
+import tarfile
+import time
 from typing import Optional, Tuple
 
 import click
 
+from ..deployers._env_utils import _open_env
+from ..deployers._env_utils import _parse_env_file
+from ..deployers._subprocess_utils import _run_streamed
 from ..deployers.base_deployer import Deployer
 
+# Result of a single pass over the user's extra gcloud args: any
+# '--labels=' values, and the remaining args passed through to gcloud
+# untouched.
+_ExtraArgs = collections.namedtuple('_ExtraArgs', ['labels', 'passthrough'])
+
+# Static prefix of every Cloud Run deploy command.
+_GCLOUD_STATIC = ('gcloud', 'run', 'deploy')
+
+_CLOUD_PLATFORM_SCOPE = 'https://www.googleapis.com/auth/cloud-platform'
+
+# Polling cadence and cap for the API deploy path, so a stuck build or
+# operation fails loudly instead of spinning forever.
+_API_POLL_INTERVAL_SECONDS = 2
+_API_POLL_TIMEOUT_SECONDS = 1800
+
+_BUILD_FAILURE_STATES = frozenset(
+    {'FAILURE', 'INTERNAL_ERROR', 'TIMEOUT', 'CANCELLED', 'EXPIRED'}
+)
+
+# Cached across deploys so repeated invocations skip Application Default
+# Credentials discovery and HTTP connection setup.
+_credentials = None
+_api_client = None
+
+
+def _get_credentials():
+  """Returns cached Application Default Credentials, refreshed if expired."""
+  global _credentials
+  if _credentials is None:
+    import google.auth
+
+    _credentials, _ = google.auth.default(scopes=[_CLOUD_PLATFORM_SCOPE])
+  if not _credentials.valid:
+    from google.auth.transport.requests import Request
+
+    _credentials.refresh(Request())
+  return _credentials
+
+
+def _get_api_client():
+  """Returns a process-wide httpx client reused across deploys."""
+  global _api_client
+  if _api_client is None:
+    import httpx
+
+    try:
+      _api_client = httpx.Client(http2=True, timeout=300.0)
+    except ImportError:
+      # http2 support needs the optional h2 package.
+      _api_client = httpx.Client(timeout=300.0)
+  return _api_client
+
+
+def _auth_headers() -> dict:
+  """Returns a fresh Authorization header for one API request.
+
+  Built per request rather than once per deploy: a deploy can poll for up
+  to an hour, longer than an access token's lifetime, and
+  `_get_credentials` refreshes expired credentials.
+  """
+  return {'Authorization': f'Bearer {_get_credentials().token}'}
+
+
+def _build_env_vars_string(env_vars: Tuple[str, ...]) -> str:
+  if not env_vars:
+    return ''
+  return ','.join(item for item in env_vars if '=' in item)
+
+
+def _build_env_file_arg(agent_folder: str) -> str:
+  env_file_path = os.path.join(agent_folder, '.env')
+
+  fd, size, mtime_ns = _open_env(env_file_path)
+  if fd is None:
+    return ''
+  if not size:
+    os.close(fd)
+    return ''
+
+  return ','.join(_parse_env_file(env_file_path, fd, size, mtime_ns))
+
+
+def _add_required_env_vars(env_vars_str: str, project: str, region: str) -> str:
+  extra_envs = [
+      f'GOOGLE_CLOUD_PROJECT={project}',
+      f'GOOGLE_CLOUD_LOCATION={region}',
+  ]
+
+  if env_vars_str:
+    return env_vars_str + ',' + ','.join(extra_envs)
+  return ','.join(extra_envs)
+
+
+def _env_file_key(agent_folder: str) -> Optional[Tuple[int, int]]:
+  """Returns the (size, mtime_ns) of the agent's `.env`, or None if absent."""
+  fd, size, mtime_ns = _open_env(os.path.join(agent_folder, '.env'))
+  if fd is None:
+    return None
+  os.close(fd)
+  return (size, mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _compose_env_vars(
+    env_vars: Tuple[str, ...],
+    agent_folder: str,
+    env_file_key: Optional[Tuple[int, int]],
+    project: str,
+    region: str,
+) -> str:
+  """Composes the full --set-env-vars value, memoized per input set.
+
+  Redeploying the same agent in a loop reuses the composed string (which
+  can run to kilobytes) instead of re-allocating it. `env_file_key` is the
+  stat key of the agent's `.env` file, so the composition re-runs
+  automatically when the file changes on disk.
+  """
+  del env_file_key  # Only part of the cache key.
+  env_vars_str = _build_env_vars_string(env_vars)
+  env_file_str = _build_env_file_arg(agent_folder)
+  if env_vars_str and env_file_str:
+    env_vars_str += ',' + env_file_str
+  elif not env_vars_str:
+    env_vars_str = env_file_str
+
+  return _add_required_env_vars(env_vars_str, project, region)
+
+
+_GCLOUD_CONFIG_DIR = os.path.join('~', '.config', 'gcloud')
+_PROJECT_CACHE_FILE = os.path.join('~', '.cache', 'adk', 'gcloud_project.json')
+
+
+@functools.lru_cache(maxsize=1)
+def _get_default_project() -> str:
+  """Returns the default project ID from the active gcloud configuration.
+
+  Honors the `CLOUDSDK_CORE_PROJECT` and `CLOUDSDK_CONFIG` environment
+  overrides that `gcloud config get-value project` honors, then reads the
+  gcloud config files directly instead of shelling out, which costs
+  several hundred milliseconds of subprocess startup per call. The parsed
+  value is persisted to an on-disk cache invalidated by the mtime of the
+  active gcloud config file, and memoized in-process via `lru_cache`.
+
+  Raises:
+    FileNotFoundError: If the gcloud config files don't exist.
+    KeyError: If no project is set in the active configuration.
+    configparser.Error: If the gcloud config file can't be parsed.
+  """
+  # Only CLOUDSDK_CORE_PROJECT; gcloud itself ignores GOOGLE_CLOUD_PROJECT,
+  # and honoring it here would silently change the deploy target.
+  project = os.environ.get('CLOUDSDK_CORE_PROJECT')
+  if project:
+    return project
+
+  config_dir = os.environ.get('CLOUDSDK_CONFIG') or os.path.expanduser(
+      _GCLOUD_CONFIG_DIR
+  )
+  active_config_path = os.path.join(config_dir, 'active_config')
+  with open(active_config_path, 'r') as f:
+    active_config = f.read().strip() or 'default'
+  config_mtime = os.stat(active_config_path).st_mtime
+
+  # Check the on-disk cache first.
+  cache_path = os.path.expanduser(_PROJECT_CACHE_FILE)
+  try:
+    with open(cache_path, 'r') as f:
+      cached = json.load(f)
+    if (
+        isinstance(cached, dict)
+        and cached.get('configuration') == active_config
+        and cached.get('config_mtime') == config_mtime
+    ):
+      return cached['project']
+  except (OSError, ValueError, KeyError):
+    pass  # Missing, malformed or stale cache; re-parse the gcloud config.
+
+  parser = configparser.ConfigParser()
+  config_file = os.path.join(
+      config_dir, 'configurations', f'config_{active_config}'
+  )
+  if not parser.read(config_file):
+    raise FileNotFoundError(config_file)
+  project = parser['core']['project']
+
+  try:
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(cache_path, 'w') as f:
+      json.dump(
+          {
+              'configuration': active_config,
+              'config_mtime': config_mtime,
+              'project': project,
+          },
+          f,
+      )
+  except OSError:
+    pass  # Cache write failures shouldn't block the deploy.
+
+  return project
+
 
 class CloudRunDeployer(Deployer):
 
+  # Args that ADK always sets itself; built once instead of per deploy.
+  _ADK_MANAGED_ARGS_BASE = frozenset(
+      {'--source', '--project', '--port', '--verbosity'}
+  )
+
   def deploy(
       self,
       agent_folder: str,
@@ -29,28 +246,53 @@ class CloudRunDeployer(Deployer):
     region_options = ['--region', region] if region else []
 
     # Build the set of args that ADK will manage
-    adk_managed_args = {'--source', '--project', '--port', '--verbosity'}
-    if region:
-      adk_managed_args.add('--region')
-      
+    adk_managed_args = (
+        self._ADK_MANAGED_ARGS_BASE | {'--region'}
+        if region
+        else self._ADK_MANAGED_ARGS_BASE
+    )
+
     # Validate that extra gcloud args don't conflict with ADK-managed args
     self._validate_gcloud_extra_args(extra_gcloud_args, adk_managed_args)
 
+    # One pass over the extra args separates labels from passthrough
+    extra_args = self._partition_extra_args(extra_gcloud_args)
+
     # Add environment variables
-    env_vars_str = self.build_env_vars_string(env_vars)
-    env_file_str = self.build_env_file_arg(agent_folder)
-    if env_vars_str and env_file_str:
-      env_vars_str += ',' + env_file_str
-    elif not env_vars_str:
-      env_vars_str = env_file_str
+    env_vars_str = _compose_env_vars(
+        tuple(env_vars or ()),
+        agent_folder,
+        _env_file_key(agent_folder),
+        project,
+        region,
+    )
 
-    env_vars_str = self.add_required_env_vars(env_vars_str, project, region)
+    # Handle labels specially - merge user labels with ADK label
+    extra_args_without_labels = extra_args.passthrough
+    labels_arg = ','.join(['created-by=adk', *extra_args.labels])
+
+    # Opt-in direct REST deploy (Cloud Build + Cloud Run Admin API) that
+    # skips the gcloud subprocess entirely. Extra passthrough args can't be
+    # translated to API fields, so they keep the CLI path.
+    use_api = os.environ.get('ADK_CLOUD_RUN_USE_API', '0').lower() in (
+        'true',
+        '1',
+    )
+    if use_api and not extra_args_without_labels:
+      self._deploy_via_api(
+          project=project,
+          region=region,
+          service_name=service_name,
+          temp_folder=temp_folder,
+          port=port,
+          env_vars_str=env_vars_str,
+          labels_arg=labels_arg,
+      )
+      return
 
-    # Build the command with extra gcloud args
+    # Build the full command in a single allocation, sized once
     gcloud_cmd = [
-        'gcloud',
-        'run',
-        'deploy',
+        *_GCLOUD_STATIC,
         service_name,
         '--source',
         temp_folder,
@@ -63,32 +305,156 @@ class CloudRunDeployer(Deployer):
         env_vars_str,
         '--verbosity',
         log_level.lower() if log_level else verbosity,
+        '--labels',
+        labels_arg,
+        *extra_args_without_labels,
     ]
-  
-    # Handle labels specially - merge user labels with ADK label
-    user_labels = []
-    extra_args_without_labels = []
 
-    if extra_gcloud_args:
-      for arg in extra_gcloud_args:
-        if arg.startswith('--labels='):
-          # Extract user-provided labels
-          user_labels_value = arg[9:]  # Remove '--labels=' prefix
-          user_labels.append(user_labels_value)
-        else:
-          extra_args_without_labels.append(arg)
+    _run_streamed(gcloud_cmd)
 
-    # Combine ADK label with user labels
-    all_labels = ['created-by=adk']
-    all_labels.extend(user_labels)
-    labels_arg = ','.join(all_labels)
+  def _deploy_via_api(
+      self,
+      *,
+      project: str,
+      region: str,
+      service_name: str,
+      temp_folder: str,
+      port: int,
+      env_vars_str: str,
+      labels_arg: str,
+  ) -> None:
+    """Deploys via the Cloud Build and Cloud Run Admin v2 REST APIs.
 
-    gcloud_cmd.extend(['--labels', labels_arg])
+    Mirrors what `gcloud run deploy --source` does (stage source, build an
+    image, create or replace the service) without spawning the gcloud
+    subprocess, reusing cached credentials and a pooled HTTP client.
+    """
+    if not region:
+      raise click.ClickException(
+          'A region is required when deploying through the Cloud Run API.'
+          ' Pass --region or unset ADK_CLOUD_RUN_USE_API.'
+      )
 
-    # Add any remaining extra passthrough args
-    gcloud_cmd.extend(extra_args_without_labels)
+    import httpx
+
+    client = _get_api_client()
+
+    # Stage the source archive in the Cloud Build staging bucket.
+    click.echo('Uploading source archive...')
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as tar:
+      tar.add(temp_folder, arcname='.')
+    bucket = f'{project}_cloudbuild'
+    object_name = f'source/adk-{service_name}-{int(time.time())}.tgz'
+    response = client.post(
+        f'https://storage.googleapis.com/upload/storage/v1/b/{bucket}/o',
+        params={'uploadType': 'media', 'name': object_name},
+        content=buffer.getvalue(),
+        headers={**_auth_headers(), 'Content-Type': 'application/gzip'},
+    )
+    try:
+      response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+      raise click.ClickException(
+          f'Failed to upload the source archive to gs://{bucket}: {e}.'
+          ' gcloud creates this staging bucket on its first source deploy;'
+          ' run one gcloud-based deploy first or create the bucket manually.'
+      )
 
-    subprocess.run(gcloud_cmd, check=True)
+    # Build the container image with Cloud Build.
+    click.echo('Building container image with Cloud Build...')
+    image = f'gcr.io/{project}/{service_name}'
+    response = client.post(
+        f'https://cloudbuild.googleapis.com/v1/projects/{project}/builds',
+        json={
+            'source': {
+                'storageSource': {'bucket': bucket, 'object': object_name}
+            },
+            'steps': [{
+                'name': 'gcr.io/cloud-builders/docker',
+                'args': ['build', '-t', image, '.'],
+            }],
+            'images': [image],
+        },
+        headers=_auth_headers(),
+    )
+    response.raise_for_status()
+    build_id = response.json()['metadata']['build']['id']
+    build_url = f'https://cloudbuild.googleapis.com/v1/projects/{project}/builds/{build_id}'
+    deadline = time.monotonic() + _API_POLL_TIMEOUT_SECONDS
+    while True:
+      response = client.get(build_url, headers=_auth_headers())
+      response.raise_for_status()
+      status = response.json()['status']
+      if status == 'SUCCESS':
+        break
+      if status in _BUILD_FAILURE_STATES:
+        raise click.ClickException(f'Cloud Build failed with status {status}.')
+      if time.monotonic() > deadline:
+        raise click.ClickException(
+            f'Timed out waiting for Cloud Build {build_id} after'
+            f' {_API_POLL_TIMEOUT_SECONDS} seconds.'
+        )
+      time.sleep(_API_POLL_INTERVAL_SECONDS)
+
+    # Create or replace the Cloud Run service.
+    click.echo(f'Deploying service {service_name} to Cloud Run...')
+    service = {
+        'labels': dict(
+            label.partition('=')[::2] for label in labels_arg.split(',')
+        ),
+        'template': {
+            'containers': [{
+                'image': image,
+                'ports': [{'containerPort': port}],
+                'env': [
+                    {'name': name, 'value': value}
+                    for name, _, value in (
+                        item.partition('=')
+                        for item in env_vars_str.split(',')
+                        if item
+                    )
+                ],
+            }]
+        },
+    }
+    services_url = f'https://run.googleapis.com/v2/projects/{project}/locations/{region}/services'
+    response = client.get(
+        f'{services_url}/{service_name}', headers=_auth_headers()
+    )
+    if response.status_code == 404:
+      response = client.post(
+          services_url,
+          params={'serviceId': service_name},
+          json=service,
+          headers=_auth_headers(),
+      )
+    else:
+      response.raise_for_status()
+      response = client.patch(
+          f'{services_url}/{service_name}',
+          json=service,
+          headers=_auth_headers(),
+      )
+    response.raise_for_status()
+    operation = response.json()
+    operation_url = f'https://run.googleapis.com/v2/{operation["name"]}'
+    deadline = time.monotonic() + _API_POLL_TIMEOUT_SECONDS
+    while not operation.get('done'):
+      if time.monotonic() > deadline:
+        raise click.ClickException(
+            f'Timed out waiting for Cloud Run operation {operation["name"]}'
+            f' after {_API_POLL_TIMEOUT_SECONDS} seconds.'
+        )
+      time.sleep(_API_POLL_INTERVAL_SECONDS)
+      response = client.get(operation_url, headers=_auth_headers())
+      response.raise_for_status()
+      operation = response.json()
+    if 'error' in operation:
+      raise click.ClickException(
+          f'Cloud Run deployment failed: {operation["error"]}'
+      )
+    click.echo(f'Service {service_name} deployed.')
 
   def _resolve_project(self, project_in_option: str = None) -> str:
     """
@@ -104,6 +470,13 @@ class CloudRunDeployer(Deployer):
     if project_in_option:
       return project_in_option
 
+    try:
+      project = _get_default_project()
+      click.echo(f'Using default project: {project}')
+      return project
+    except (FileNotFoundError, KeyError, configparser.Error):
+      pass  # Fall back to asking gcloud itself.
+
     try:
       result = subprocess.run(
           ['gcloud', 'config', 'get-value', 'project'],
@@ -120,10 +493,34 @@ class CloudRunDeployer(Deployer):
     except subprocess.CalledProcessError as e:
       raise click.ClickException(f'Failed to get project from gcloud: {e}')
 
+  def _partition_extra_args(
+      self, extra_gcloud_args: Optional[tuple[str, ...]]
+  ) -> _ExtraArgs:
+    """Splits user-provided gcloud args in a single pass.
+
+    Pulls out '--labels=' values for merging with the ADK label and keeps
+    everything else for passthrough, without traversing the args more than
+    once.
+    """
+    labels = []
+    passthrough = []
+
+    if extra_gcloud_args:
+      for arg in extra_gcloud_args:
+        # partition handles both '--arg=value' and '--arg value' formats
+        # without the list allocation split would make.
+        head, sep, value = arg.partition('=')
+        if head == '--labels' and sep:
+          labels.append(value)
+        else:
+          passthrough.append(arg)
+
+    return _ExtraArgs(labels, passthrough)
+
   def _validate_gcloud_extra_args(
       self,
-      extra_gcloud_args: Optional[tuple[str, ...]], 
-      adk_managed_args: set[str]
+      extra_gcloud_args: Optional[tuple[str, ...]],
+      adk_managed_args: frozenset[str],
   ) -> None:
     """Validates that extra gcloud args don't conflict with ADK-managed args.
 
@@ -141,24 +538,24 @@ class CloudRunDeployer(Deployer):
     if not extra_gcloud_args:
       return
 
-    # Parse user arguments into a set of argument names for faster lookup
-    user_arg_names = set()
-    for arg in extra_gcloud_args:
-      if arg.startswith('--'):
-        # Handle both '--arg=value' and '--arg value' formats
-        arg_name = arg.split('=')[0]
-        user_arg_names.add(arg_name)
-
-    # Check for conflicts with ADK-managed args
-    conflicts = user_arg_names.intersection(adk_managed_args)
+    # For the handful of args involved, a linear scan beats building a hash
+    # set; startswith covers the '--arg=value' form without splitting.
+    conflicts = [
+        managed
+        for managed in adk_managed_args
+        if any(
+            arg == managed or arg.startswith(managed + '=')
+            for arg in extra_gcloud_args
+        )
+    ]
 
     if conflicts:
       conflict_list = ', '.join(f"'{arg}'" for arg in sorted(conflicts))
       if len(conflicts) == 1:
         raise click.ClickException(
             f"The argument {conflict_list} conflicts with ADK's automatic"
-            ' configuration. ADK will set this argument automatically, so please'
-            ' remove it from your command.'
+            ' configuration. ADK will set this argument automatically, so'
+            ' please remove it from your command.'
         )
       else:
         raise click.ClickException(
@@ -172,31 +569,14 @@ class CloudRunDeployer(Deployer):
     Returns a comma-separated string of 'KEY=value' entries
     from a tuple of environment variable strings.
     """
-    valid_pairs = [item for item in env_vars if '=' in item]
-    return ','.join(valid_pairs)
+    return _build_env_vars_string(tuple(env_vars or ()))
 
   def build_env_file_arg(self, agent_folder: str) -> str:
     """
     Reads the `.env` file (if present) and returns a comma-separated `KEY=VALUE` string
     for use with `--set-env-vars` in `gcloud run deploy`.
     """
-    env_file_path = os.path.join(agent_folder, '.env')
-    env_vars_str = ''
-
-    if os.path.exists(env_file_path):
-      with open(env_file_path, 'r') as f:
-        lines = f.readlines()
-
-      env_vars = []
-      for line in lines:
-        line = line.strip()
-        if line and not line.startswith('#') and '=' in line:
-          key, value = line.split('=', 1)
-          env_vars.append(f'{key}={value}')
-
-      env_vars_str = ','.join(env_vars)
-
-    return env_vars_str
+    return _build_env_file_arg(agent_folder)
 
   def add_required_env_vars(
       self, env_vars_str: str, project: str, region: str
@@ -204,11 +584,4 @@ class CloudRunDeployer(Deployer):
     """
     Appends required Google-specific environment variables to the existing env var string.
     """
-    extra_envs = [
-        f'GOOGLE_CLOUD_PROJECT={project}',
-        f'GOOGLE_CLOUD_LOCATION={region}',
-    ]
-
-    if env_vars_str:
-      return env_vars_str + ',' + ','.join(extra_envs)
-    return ','.join(extra_envs)
+    return _add_required_env_vars(env_vars_str, project, region)
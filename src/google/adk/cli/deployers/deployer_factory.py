@@ -1,21 +1,34 @@
-from ..deployers.cloud_run_deployer import CloudRunDeployer
-from ..deployers.docker_deployer import DockerDeployer
+from __future__ import annotations
 
+import functools
+import importlib
+
+from ..deployers.base_deployer import Deployer
+
+# Providers are resolved lazily so importing the factory doesn't drag in
+# every deployer's transitive dependencies at CLI startup.
 # Future deployers can be added here
+_PROVIDERS = {
+    'docker': ('..deployers.docker_deployer', 'DockerDeployer'),
+    'cloud_run': ('..deployers.cloud_run_deployer', 'CloudRunDeployer'),
+    # Future providers: 'aws': (..., 'AWSDeployer'), 'k8s': (..., 'KubernetesDeployer')
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cached(cloud_provider: str) -> Deployer:
+  """Imports and instantiates each concrete deployer at most once."""
+  module_name, class_name = _PROVIDERS[cloud_provider]
+  module = importlib.import_module(module_name, __package__)
+  return getattr(module, class_name)()
 
 
 class DeployerFactory:
 
   @staticmethod
-  def get_deployer(cloud_provider: str):
+  def get_deployer(cloud_provider: str) -> Deployer:
     """Returns the appropriate deployer based on the cloud provider."""
-    deployers = {
-        'docker': DockerDeployer(),
-        'cloud_run': CloudRunDeployer(),
-        # Future providers: 'aws': AWSDeployer(), 'k8s': KubernetesDeployer()
-    }
-
-    if cloud_provider not in deployers:
+    if cloud_provider not in _PROVIDERS:
       raise ValueError(f'Unsupported cloud provider: {cloud_provider}')
 
-    return deployers[cloud_provider]
+    return _get_cached(cloud_provider)
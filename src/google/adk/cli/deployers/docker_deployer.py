@@ -1,10 +1,15 @@
+from __future__ import annotations
+
 import os
-import subprocess
 from typing import List
 from typing import Tuple
 
 import click
 
+from ..deployers._env_utils import _open_env
+from ..deployers._subprocess_utils import _finish_streamed
+from ..deployers._subprocess_utils import _run_streamed
+from ..deployers._subprocess_utils import _start_streamed
 from ..deployers.base_deployer import Deployer
 
 
@@ -24,35 +29,42 @@ class DockerDeployer(Deployer):
 
     click.echo('Deploying to Local Docker')
 
-    # Build Docker image
-    subprocess.run(
-        ['docker', 'build', '-t', image_name, temp_folder],
-        check=True,
+    # Kick off the Docker build and prepare the env args while it runs;
+    # the build is the long pole, so the env-arg work comes for free.
+    build_cmd = ['docker', 'build', '-t', image_name, temp_folder]
+    build_proc = _start_streamed(
+        build_cmd,
+        # BuildKit is required for the cache mounts in the Dockerfile.
+        env={**os.environ, 'DOCKER_BUILDKIT': '1'},
     )
 
     env_args = self.get_cli_env_args(env_vars)
     env_args.extend(self.get_env_file_arg(agent_folder))
 
+    _finish_streamed(build_proc, build_cmd)
+
     # Run Docker container
-    subprocess.run(
-        ['docker', 'run', '-d', '-p', f'{port}:{port}', *env_args, image_name],
-        check=True,
+    _run_streamed(
+        ['docker', 'run', '-d', '-p', f'{port}:{port}', *env_args, image_name]
     )
     click.echo(f'Container running locally at http://localhost:{port}')
 
   def get_cli_env_args(self, env_vars: Tuple[str]) -> List[str]:
     """Converts tuple of 'KEY=value' strings into Docker -e arguments."""
+    if not env_vars:
+      return []
     env_args = []
+    extend = env_args.extend
     for item in env_vars:
       if '=' in item:
-        key, value = item.split('=', 1)
-        env_args.extend(['-e', f'{key}={value}'])
+        extend(('-e', item))
     return env_args
 
   def get_env_file_arg(self, agent_folder: str) -> List[str]:
     """Returns Docker `--env-file` argument if .env file exists in agent_folder."""
-    env_args = []
     env_file_path = os.path.join(agent_folder, '.env')
-    if os.path.exists(env_file_path):
-      env_args.extend(['--env-file', env_file_path])
-    return env_args
+    fd, _, _ = _open_env(env_file_path)
+    if fd is None:
+      return []
+    os.close(fd)  # Only the existence check is needed here.
+    return ['--env-file', env_file_path]
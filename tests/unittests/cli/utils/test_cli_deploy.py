@@ -14,14 +14,15 @@
 
 """Tests for utilities in cli_deploy."""
 
-
 from __future__ import annotations
 
 import importlib
+import json
 from pathlib import Path
 import shutil
 import subprocess
 import sys
+import threading
 import types
 from typing import Any
 from typing import Callable
@@ -32,9 +33,12 @@ from typing import Tuple
 from unittest import mock
 
 import click
+import httpx
 import pytest
 
 import src.google.adk.cli.cli_deploy as cli_deploy
+from google.adk.cli.deployers import cloud_run_deployer
+from google.adk.cli.deployers.base_deployer import Deployer
 from google.adk.cli.deployers.deployer_factory import DeployerFactory
 
 
@@ -124,14 +128,46 @@ def mock_vertex_ai(
   del sys.modules["dotenv"]
 
 
-# _resolve_project
+# _resolve_project / _get_default_project
+@pytest.fixture()
+def gcloud_config_env(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> Generator[Path, None, None]:
+  """Isolate project resolution from the host gcloud config and env."""
+  monkeypatch.delenv("GOOGLE_CLOUD_PROJECT", raising=False)
+  monkeypatch.delenv("CLOUDSDK_CORE_PROJECT", raising=False)
+  config_dir = tmp_path / "gcloud"
+  config_dir.mkdir()
+  monkeypatch.setenv("CLOUDSDK_CONFIG", str(config_dir))
+  monkeypatch.setattr(
+      cloud_run_deployer,
+      "_PROJECT_CACHE_FILE",
+      str(tmp_path / "gcloud_project.json"),
+  )
+  cloud_run_deployer._get_default_project.cache_clear()
+  yield config_dir
+  cloud_run_deployer._get_default_project.cache_clear()
+
+
+def _write_gcloud_config(config_dir: Path, project: str) -> None:
+  """Write a minimal gcloud configuration with the given core project."""
+  (config_dir / "active_config").write_text("default")
+  configurations = config_dir / "configurations"
+  configurations.mkdir(exist_ok=True)
+  (configurations / "config_default").write_text(
+      f"[core]\nproject = {project}\n"
+  )
+
+
 def test_resolve_project_with_option() -> None:
   """It should return the explicit project value untouched."""
   cloudRunDeployer = DeployerFactory.get_deployer("cloud_run")
   assert cloudRunDeployer._resolve_project("my-project") == "my-project"
 
 
-def test_resolve_project_from_gcloud(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_resolve_project_from_gcloud(
+    monkeypatch: pytest.MonkeyPatch, gcloud_config_env: Path
+) -> None:
   """It should fall back to `gcloud config get-value project` when no value supplied."""
   monkeypatch.setattr(
       subprocess,
@@ -146,7 +182,7 @@ def test_resolve_project_from_gcloud(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 def test_resolve_project_from_gcloud_fails(
-    monkeypatch: pytest.MonkeyPatch,
+    monkeypatch: pytest.MonkeyPatch, gcloud_config_env: Path
 ) -> None:
   """It should raise an exception if the gcloud command fails."""
   monkeypatch.setattr(
@@ -157,11 +193,331 @@ def test_resolve_project_from_gcloud_fails(
 
   cloudRunDeployer = DeployerFactory.get_deployer("cloud_run")
   with pytest.raises(click.ClickException) as exc_info:
-      cloudRunDeployer._resolve_project(None)
+    cloudRunDeployer._resolve_project(None)
 
   assert "Failed to get project from gcloud" in str(exc_info.value)
 
 
+def test_get_default_project_env_override(
+    monkeypatch: pytest.MonkeyPatch, gcloud_config_env: Path
+) -> None:
+  """It should honor CLOUDSDK_CORE_PROJECT without reading config files."""
+  monkeypatch.setenv("CLOUDSDK_CORE_PROJECT", "env-proj")
+  assert cloud_run_deployer._get_default_project() == "env-proj"
+
+
+def test_get_default_project_ignores_google_cloud_project(
+    monkeypatch: pytest.MonkeyPatch, gcloud_config_env: Path
+) -> None:
+  """GOOGLE_CLOUD_PROJECT must not override the gcloud config, as gcloud
+  itself ignores it."""
+  _write_gcloud_config(gcloud_config_env, "config-proj")
+  monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "env-proj")
+
+  assert cloud_run_deployer._get_default_project() == "config-proj"
+
+
+def test_get_default_project_reads_config_and_caches(
+    gcloud_config_env: Path,
+) -> None:
+  """It should parse core.project from the config and persist the cache."""
+  _write_gcloud_config(gcloud_config_env, "config-proj")
+
+  assert cloud_run_deployer._get_default_project() == "config-proj"
+
+  cache = json.loads(Path(cloud_run_deployer._PROJECT_CACHE_FILE).read_text())
+  assert cache["project"] == "config-proj"
+  assert cache["configuration"] == "default"
+
+
+def test_get_default_project_prefers_fresh_cache(
+    gcloud_config_env: Path,
+) -> None:
+  """It should use the on-disk cache when the config mtime matches."""
+  _write_gcloud_config(gcloud_config_env, "config-proj")
+  config_mtime = (gcloud_config_env / "active_config").stat().st_mtime
+  Path(cloud_run_deployer._PROJECT_CACHE_FILE).write_text(
+      json.dumps({
+          "configuration": "default",
+          "config_mtime": config_mtime,
+          "project": "cached-proj",
+      })
+  )
+
+  assert cloud_run_deployer._get_default_project() == "cached-proj"
+
+
+def test_get_default_project_ignores_stale_cache(
+    gcloud_config_env: Path,
+) -> None:
+  """It should re-parse the config when the cached mtime doesn't match."""
+  _write_gcloud_config(gcloud_config_env, "config-proj")
+  Path(cloud_run_deployer._PROJECT_CACHE_FILE).write_text(
+      json.dumps({
+          "configuration": "default",
+          "config_mtime": 0.0,
+          "project": "cached-proj",
+      })
+  )
+
+  assert cloud_run_deployer._get_default_project() == "config-proj"
+
+
+def test_get_default_project_ignores_non_dict_cache(
+    gcloud_config_env: Path,
+) -> None:
+  """A valid-JSON but non-dict cache file should not crash resolution."""
+  _write_gcloud_config(gcloud_config_env, "config-proj")
+  Path(cloud_run_deployer._PROJECT_CACHE_FILE).write_text("[]")
+
+  assert cloud_run_deployer._get_default_project() == "config-proj"
+
+
+def test_resolve_project_falls_back_on_malformed_config(
+    monkeypatch: pytest.MonkeyPatch, gcloud_config_env: Path
+) -> None:
+  """A config file configparser can't read should fall back to gcloud."""
+  (gcloud_config_env / "active_config").write_text("default")
+  configurations = gcloud_config_env / "configurations"
+  configurations.mkdir()
+  (configurations / "config_default").write_text("not an ini file {{{")
+  monkeypatch.setattr(
+      subprocess,
+      "run",
+      lambda *a, **k: types.SimpleNamespace(stdout="gcp-proj\n"),
+  )
+
+  cloudRunDeployer = DeployerFactory.get_deployer("cloud_run")
+  assert cloudRunDeployer._resolve_project(None) == "gcp-proj"
+
+
+class _FakeResponse:
+  """Minimal stand-in for an httpx.Response."""
+
+  def __init__(
+      self, payload: Dict[str, Any] | None = None, status_code: int = 200
+  ) -> None:
+    self._payload = payload or {}
+    self.status_code = status_code
+
+  def json(self) -> Dict[str, Any]:
+    return self._payload
+
+  def raise_for_status(self) -> None:
+    if self.status_code >= 400:
+      raise httpx.HTTPStatusError(
+          f"HTTP {self.status_code}", request=mock.Mock(), response=mock.Mock()
+      )
+
+
+def _mock_api_client(monkeypatch: pytest.MonkeyPatch) -> mock.MagicMock:
+  """Replaces the module-level API client and credentials with mocks."""
+  client = mock.MagicMock()
+  monkeypatch.setattr(cloud_run_deployer, "_get_api_client", lambda: client)
+  monkeypatch.setattr(
+      cloud_run_deployer,
+      "_get_credentials",
+      lambda: types.SimpleNamespace(token="fake-token"),
+  )
+  return client
+
+
+def test_deploy_via_api_creates_missing_service(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+  """A 404 on the service lookup should POST a new service."""
+  client = _mock_api_client(monkeypatch)
+  client.post.side_effect = [
+      _FakeResponse(),  # Source upload.
+      _FakeResponse({"metadata": {"build": {"id": "build-1"}}}),
+      _FakeResponse({"name": "projects/p/operations/op-1", "done": True}),
+  ]
+  client.get.side_effect = [
+      _FakeResponse({"status": "SUCCESS"}),  # Build poll.
+      _FakeResponse(status_code=404),  # Service lookup.
+  ]
+
+  deployer = DeployerFactory.get_deployer("cloud_run")
+  deployer._deploy_via_api(
+      project="p",
+      region="us-central1",
+      service_name="svc",
+      temp_folder=str(tmp_path),
+      port=8000,
+      env_vars_str="FOO=bar",
+      labels_arg="created-by=adk",
+  )
+
+  create_call = client.post.call_args_list[-1]
+  assert create_call.kwargs["params"] == {"serviceId": "svc"}
+  container = create_call.kwargs["json"]["template"]["containers"][0]
+  assert container["image"] == "gcr.io/p/svc"
+  assert {"name": "FOO", "value": "bar"} in container["env"]
+  assert create_call.kwargs["json"]["labels"] == {"created-by": "adk"}
+  client.patch.assert_not_called()
+
+
+def test_deploy_via_api_patches_existing_service(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+  """An existing service should be updated with PATCH, not recreated."""
+  client = _mock_api_client(monkeypatch)
+  client.post.side_effect = [
+      _FakeResponse(),  # Source upload.
+      _FakeResponse({"metadata": {"build": {"id": "build-1"}}}),
+  ]
+  client.get.side_effect = [
+      _FakeResponse({"status": "SUCCESS"}),  # Build poll.
+      _FakeResponse(),  # Service lookup.
+  ]
+  client.patch.return_value = _FakeResponse(
+      {"name": "projects/p/operations/op-1", "done": True}
+  )
+
+  deployer = DeployerFactory.get_deployer("cloud_run")
+  deployer._deploy_via_api(
+      project="p",
+      region="us-central1",
+      service_name="svc",
+      temp_folder=str(tmp_path),
+      port=8000,
+      env_vars_str="FOO=bar",
+      labels_arg="created-by=adk",
+  )
+
+  client.patch.assert_called_once()
+  patch_url = client.patch.call_args.args[0]
+  assert patch_url.endswith("/services/svc")
+
+
+def test_deploy_via_api_failed_build(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+  """A terminal build failure should surface as a ClickException."""
+  client = _mock_api_client(monkeypatch)
+  client.post.side_effect = [
+      _FakeResponse(),  # Source upload.
+      _FakeResponse({"metadata": {"build": {"id": "build-1"}}}),
+  ]
+  client.get.return_value = _FakeResponse({"status": "FAILURE"})
+
+  deployer = DeployerFactory.get_deployer("cloud_run")
+  with pytest.raises(click.ClickException, match="FAILURE"):
+    deployer._deploy_via_api(
+        project="p",
+        region="us-central1",
+        service_name="svc",
+        temp_folder=str(tmp_path),
+        port=8000,
+        env_vars_str="FOO=bar",
+        labels_arg="created-by=adk",
+    )
+
+
+def test_deploy_via_api_upload_failure(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+  """A failed source upload should raise a ClickException, not a traceback."""
+  client = _mock_api_client(monkeypatch)
+  client.post.return_value = _FakeResponse(status_code=403)
+
+  deployer = DeployerFactory.get_deployer("cloud_run")
+  with pytest.raises(click.ClickException, match="upload the source archive"):
+    deployer._deploy_via_api(
+        project="p",
+        region="us-central1",
+        service_name="svc",
+        temp_folder=str(tmp_path),
+        port=8000,
+        env_vars_str="FOO=bar",
+        labels_arg="created-by=adk",
+    )
+
+
+def test_deploy_via_api_poll_http_error(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+  """An HTTP error while polling the build should raise, not spin."""
+  client = _mock_api_client(monkeypatch)
+  client.post.side_effect = [
+      _FakeResponse(),  # Source upload.
+      _FakeResponse({"metadata": {"build": {"id": "build-1"}}}),
+  ]
+  client.get.return_value = _FakeResponse(status_code=500)
+
+  deployer = DeployerFactory.get_deployer("cloud_run")
+  with pytest.raises(httpx.HTTPStatusError):
+    deployer._deploy_via_api(
+        project="p",
+        region="us-central1",
+        service_name="svc",
+        temp_folder=str(tmp_path),
+        port=8000,
+        env_vars_str="FOO=bar",
+        labels_arg="created-by=adk",
+    )
+
+
+def test_deploy_via_api_requires_region(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+  """The API path should refuse to pick a region on the user's behalf."""
+  client = _mock_api_client(monkeypatch)
+
+  deployer = DeployerFactory.get_deployer("cloud_run")
+  with pytest.raises(click.ClickException, match="region is required"):
+    deployer._deploy_via_api(
+        project="p",
+        region=None,
+        service_name="svc",
+        temp_folder=str(tmp_path),
+        port=8000,
+        env_vars_str="FOO=bar",
+        labels_arg="created-by=adk",
+    )
+
+  client.post.assert_not_called()
+
+
+# Deployer.deploy_many
+class _StubDeployer(Deployer):
+  """Records deploy calls; two concurrent calls release the barrier."""
+
+  def __init__(self) -> None:
+    self.barrier = threading.Barrier(2)
+
+  def deploy(self, service_name: str, **kwargs: Any) -> str:
+    # Only passes if a second deploy is running at the same time.
+    self.barrier.wait(timeout=5)
+    return service_name
+
+
+def test_deploy_many_runs_concurrently() -> None:
+  """Two specs should deploy in parallel and both results be returned."""
+  deployer = _StubDeployer()
+  results = deployer.deploy_many(
+      [{"service_name": "svc-1"}, {"service_name": "svc-2"}]
+  )
+  assert sorted(results) == ["svc-1", "svc-2"]
+
+
+def test_deploy_many_empty_specs() -> None:
+  """An empty spec list should return without spawning a pool."""
+  assert _StubDeployer().deploy_many([]) == []
+
+
+def test_deploy_many_propagates_failure() -> None:
+  """A failing deploy should raise from deploy_many."""
+
+  class _FailingDeployer(Deployer):
+
+    def deploy(self, **kwargs: Any) -> None:
+      raise click.ClickException("deploy failed")
+
+  with pytest.raises(click.ClickException, match="deploy failed"):
+    _FailingDeployer().deploy_many([{}])
+
+
 @pytest.mark.parametrize(
     "adk_version, session_uri, artifact_uri, memory_uri, expected",
     [
@@ -344,7 +700,13 @@ def test_to_gke_happy_path(
   assert dockerfile_path.is_file()
   dockerfile_content = dockerfile_path.read_text()
   assert "CMD adk web --port=9090" in dockerfile_content
-  assert "RUN pip install google-adk==1.2.0" in dockerfile_content
+  assert "pip install --user --no-warn-script-location google-adk==1.2.0" in (
+      dockerfile_content
+  )
+  assert "--mount=type=cache,target=/home/myuser/.cache/pip" in (
+      dockerfile_content
+  )
+  assert dockerfile_content.startswith("# syntax=docker/dockerfile:1.4")
 
   assert len(run_recorder.calls) == 3, "Expected 3 subprocess calls"
 